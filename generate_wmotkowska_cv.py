@@ -5,9 +5,16 @@ Theme: Minimal White Blue Modern
 Layout: Single-page, two-column
 """
 
+import argparse
 import csv
+import gc
+import io
 import os
+import tracemalloc
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import A4
@@ -185,7 +192,11 @@ COLORS = {
 
 
 def register_fonts():
-    """Register fonts from canvas-fonts directory."""
+    """Register fonts from canvas-fonts directory (once per process)."""
+    # pdfmetrics keeps a module-level registry; re-registering on every
+    # render re-parses the TTF files and keeps growing its caches.
+    if "Accent" in pdfmetrics.getRegisteredFontNames():
+        return
     pdfmetrics.registerFont(TTFont("Display", FONTS_DIR / "BricolageGrotesque-Bold.ttf"))
     pdfmetrics.registerFont(TTFont("Body", FONTS_DIR / "BricolageGrotesque-Regular.ttf"))
     pdfmetrics.registerFont(TTFont("Accent", FONTS_DIR / "JetBrainsMono-Regular.ttf"))
@@ -481,19 +492,73 @@ def create_compact_styles():
     }
 
 
-def add_section_heading_compact(flowables, styles, title):
-    """Add a section heading with balanced spacing."""
-    flowables.append(Spacer(1, 10))
-    flowables.append(HRFlowable(
-        width="100%", thickness=0.4, color=COLORS["rule"],
-        spaceAfter=5, spaceBefore=0,
-    ))
-    flowables.append(Paragraph(title.upper(), styles["section_heading"]))
-    flowables.append(Spacer(1, 5))
+def create_section_heading_compact(styles, title):
+    """Create a section heading with balanced spacing."""
+    return (
+        Spacer(1, 10),
+        HRFlowable(
+            width="100%", thickness=0.4, color=COLORS["rule"],
+            spaceAfter=5, spaceBefore=0,
+        ),
+        Paragraph(title.upper(), styles["section_heading"]),
+        Spacer(1, 5),
+    )
+
+
+def create_column_table_style():
+    """Create the table style for a single column of stacked flowables."""
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+
+
+def create_main_table_style():
+    """Create the table style for the two-column page grid."""
+    return TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (0, 0), 0),
+        ('LEFTPADDING', (1, 0), (1, 0), GUTTER),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+
 
+@lru_cache(maxsize=None)
+def get_layout():
+    """Build the theme's static layout skeleton once per process.
 
-def build_left_column(profile, contact, links, positions, styles):
+    Holds the paragraph styles, section headings, rules, spacers and
+    table styles that are identical for every CV, so each render only
+    allocates the content paragraphs. The flowables are reused by every
+    render and reportlab stores per-render state on them, as it does on
+    its registered fonts, so renders must run one at a time. The shared
+    objects must not be modified.
+    """
+    styles = create_compact_styles()
+    headings = {
+        title: create_section_heading_compact(styles, title)
+        for title in ("Experience", "Skills", "Certifications", "Languages")
+    }
+    # Education opens the right column, so it has no rule above it
+    headings["Education"] = (Paragraph("EDUCATION", styles["section_heading"]), Spacer(1, 5))
+    return MappingProxyType({
+        "styles": MappingProxyType(styles),
+        "section_headings": MappingProxyType(headings),
+        "spacers": MappingProxyType({height: Spacer(1, height) for height in (2, 4, 6, 8)}),
+        "column_table_style": create_column_table_style(),
+        "main_table_style": create_main_table_style(),
+    })
+
+
+def build_left_column(profile, contact, links, positions, layout):
     """Build left column: Header + Experience."""
+    styles = layout["styles"]
+    spacers = layout["spacers"]
     flowables = []
     
     # Name
@@ -513,7 +578,7 @@ def build_left_column(profile, contact, links, positions, styles):
     if contact.get("phone"):
         contact_parts.append(contact["phone"])
     if contact_parts:
-        flowables.append(Spacer(1, 2))
+        flowables.append(spacers[2])
         flowables.append(Paragraph(" · ".join(contact_parts), styles["contact"]))
     
     # Links line (portfolio, personal projects)
@@ -523,16 +588,16 @@ def build_left_column(profile, contact, links, positions, styles):
             # Create clickable link with label
             link_text = f'<link href="{link["url"]}">{escape(link["label"])}</link> {link["display"]}'
             links_parts.append(link_text)
-        flowables.append(Spacer(1, 2))
+        flowables.append(spacers[2])
         flowables.append(Paragraph(" · ".join(links_parts), styles["contact"]))
     
     # Experience
     if positions:
-        add_section_heading_compact(flowables, styles, "Experience")
+        flowables.extend(layout["section_headings"]["Experience"])
         
         for i, pos in enumerate(positions[:7]):
             if i > 0:
-                flowables.append(Spacer(1, 8))
+                flowables.append(spacers[8])
             
             flowables.append(Paragraph(escape(pos["title"]), styles["job_title"]))
             
@@ -547,18 +612,19 @@ def build_left_column(profile, contact, links, positions, styles):
     return flowables
 
 
-def build_right_column(education, skills, certifications, languages, styles):
+def build_right_column(education, skills, certifications, languages, layout):
     """Build right column: Education + Skills + Certs + Languages."""
+    styles = layout["styles"]
+    spacers = layout["spacers"]
     flowables = []
     
     # Education - show all entries without grouping to preserve all degrees
     if education:
-        flowables.append(Paragraph("EDUCATION", styles["section_heading"]))
-        flowables.append(Spacer(1, 5))
+        flowables.extend(layout["section_headings"]["Education"])
         
         for i, edu in enumerate(education):
             if i > 0:
-                flowables.append(Spacer(1, 6))
+                flowables.append(spacers[6])
             
             flowables.append(Paragraph(escape(edu["school"]), styles["job_title"]))
             
@@ -582,7 +648,7 @@ def build_right_column(education, skills, certifications, languages, styles):
     
     # Skills - show ALL skills grouped by category
     if skills:
-        add_section_heading_compact(flowables, styles, "Skills")
+        flowables.extend(layout["section_headings"]["Skills"])
         
         # Define display order for categories
         category_order = ["Programming", "Data Science & ML", "AI & Automation", 
@@ -593,21 +659,21 @@ def build_right_column(education, skills, certifications, languages, styles):
                 category_skills = skills[category]
                 category_text = f"<b>{category}:</b> {', '.join(category_skills)}"
                 flowables.append(Paragraph(category_text, styles["skills"]))
-                flowables.append(Spacer(1, 4))
+                flowables.append(spacers[4])
     
     # Certifications - show full names without truncation
     if certifications:
-        add_section_heading_compact(flowables, styles, "Certifications")
+        flowables.extend(layout["section_headings"]["Certifications"])
         
         for cert in certifications:
             flowables.append(Paragraph(escape(cert["name"]), styles["cert_name"]))
             if cert.get("authority"):
                 flowables.append(Paragraph(escape(cert["authority"]), styles["date_range"]))
-            flowables.append(Spacer(1, 4))
+            flowables.append(spacers[4])
     
     # Languages
     if languages:
-        add_section_heading_compact(flowables, styles, "Languages")
+        flowables.extend(layout["section_headings"]["Languages"])
         
         lang_parts = []
         for lang in languages:
@@ -618,23 +684,33 @@ def build_right_column(education, skills, certifications, languages, styles):
     return flowables
 
 
-def build_cv():
-    """Build a single-page, two-column CV."""
-    register_fonts()
+def build_cv(output_file=OUTPUT_FILE, profiler=None):
+    """Build a single-page, two-column CV.
+
+    ``output_file`` may be a path or a binary file-like object. Pass a
+    ``MemoryProfiler`` to record allocations for each rendering stage.
+    """
+    profiler = profiler or NullProfiler()
     
-    profile = parse_profile()
-    contact = parse_contact()
-    links = parse_links()
-    positions = parse_positions()
-    education = parse_education()
-    skills = parse_skills()
-    languages = parse_languages()
-    certifications = parse_certifications()
+    with profiler.stage("fonts"):
+        register_fonts()
     
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with profiler.stage("parse"):
+        profile = parse_profile()
+        contact = parse_contact()
+        links = parse_links()
+        positions = parse_positions()
+        education = parse_education()
+        skills = parse_skills()
+        languages = parse_languages()
+        certifications = parse_certifications()
+    
+    is_path = isinstance(output_file, (str, Path))
+    if is_path:
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
     
     doc = SimpleDocTemplate(
-        str(OUTPUT_FILE),
+        str(output_file) if is_path else output_file,
         pagesize=A4,
         leftMargin=MARGIN,
         rightMargin=MARGIN,
@@ -642,52 +718,199 @@ def build_cv():
         bottomMargin=MARGIN,
     )
     
-    styles = create_compact_styles()
-    
-    left_flowables = build_left_column(profile, contact, links, positions, styles)
-    right_flowables = build_right_column(education, skills, certifications, languages, styles)
-    
-    left_table = Table(
-        [[f] for f in left_flowables],
-        colWidths=[LEFT_COL_WIDTH],
-    )
-    left_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    
-    right_table = Table(
-        [[f] for f in right_flowables],
-        colWidths=[RIGHT_COL_WIDTH],
-    )
-    right_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    
-    main_table = Table(
-        [[left_table, right_table]],
-        colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH + GUTTER],
-    )
-    main_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (0, 0), 0),
-        ('LEFTPADDING', (1, 0), (1, 0), GUTTER),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    with profiler.stage("flowables"):
+        layout = get_layout()
+        left_flowables = build_left_column(profile, contact, links, positions, layout)
+        right_flowables = build_right_column(education, skills, certifications, languages, layout)
+    
+    with profiler.stage("tables"):
+        left_table = Table(
+            [[f] for f in left_flowables],
+            colWidths=[LEFT_COL_WIDTH],
+        )
+        left_table.setStyle(layout["column_table_style"])
+        
+        right_table = Table(
+            [[f] for f in right_flowables],
+            colWidths=[RIGHT_COL_WIDTH],
+        )
+        right_table.setStyle(layout["column_table_style"])
+        
+        main_table = Table(
+            [[left_table, right_table]],
+            colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH + GUTTER],
+        )
+        main_table.setStyle(layout["main_table_style"])
     
-    doc.build([main_table])
-    return OUTPUT_FILE
+    with profiler.stage("render"):
+        doc.build([main_table])
+    return output_file
+
+
+# =============================================================================
+# MEMORY PROFILING (opt-in, tracemalloc based)
+# =============================================================================
+
+SOAK_ITERATIONS = 10_000
+SOAK_WARMUP = 50
+SOAK_THRESHOLD_KB = 512
+PROFILE_WARMUP = 1
+
+
+class NullProfiler:
+    """Profiler stand-in used when memory profiling is disabled."""
+
+    def stage(self, name):
+        return nullcontext()
+
+
+class MemoryProfiler:
+    """Record peak and retained allocations per rendering stage.
+
+    Requires ``tracemalloc`` to be tracing. ``retained`` is the traced
+    size after the stage minus the size before it; ``peak`` is the
+    highest traced size reached inside the stage, relative to its start.
+    Wrap the whole render in ``measure()`` to also record its total.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.total = None
+        self._peak = 0
+
+    def stage(self, name):
+        return _MemoryStage(self, name)
+
+    def measure(self):
+        return _MemoryStage(self, None)
+
+    def report(self):
+        """Return a printable table of per-stage and total allocations."""
+        lines = [f"{'stage':<12}{'peak KiB':>12}{'retained KiB':>15}"]
+        for name, stats in self.stages.items():
+            lines.append(
+                f"{name:<12}{stats['peak'] / 1024:>12.1f}{stats['retained'] / 1024:>15.1f}"
+            )
+        if self.total:
+            lines.append(
+                f"{'total':<12}{self.total['peak'] / 1024:>12.1f}"
+                f"{self.total['retained'] / 1024:>15.1f}"
+            )
+        return "\n".join(lines)
+
+
+class _MemoryStage:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("MemoryProfiler requires tracemalloc to be tracing")
+        if self.name is None:
+            # A new measurement starts from a clean slate when reused
+            self.profiler.stages = {}
+            self.profiler.total = None
+            self.profiler._peak = 0
+        else:
+            # Stages reset the tracemalloc peak, so fold the peak reached
+            # since the previous reset into the render-wide peak first.
+            _, peak = tracemalloc.get_traced_memory()
+            self.profiler._peak = max(self.profiler._peak, peak)
+        tracemalloc.reset_peak()
+        self.start, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def __exit__(self, *exc):
+        _, peak = tracemalloc.get_traced_memory()
+        self.profiler._peak = max(self.profiler._peak, peak)
+        # reportlab documents hold reference cycles; collect them so only
+        # memory that is really kept alive counts as retained.
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        if self.name is None:
+            peak = self.profiler._peak
+        stats = {"peak": peak - self.start, "retained": current - self.start}
+        if self.name is None:
+            self.profiler.total = stats
+        else:
+            self.profiler.stages[self.name] = stats
+        return False
+
+
+def profile_render(warmup=PROFILE_WARMUP):
+    """Render the CV under tracemalloc and return the profiler.
+
+    ``warmup`` renders run first so one-off costs (font registration,
+    cached styles) are not reported as retained by the profiled render.
+    """
+    for _ in range(warmup):
+        build_cv(io.BytesIO())
+    profiler = MemoryProfiler()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        with profiler.measure():
+            build_cv(io.BytesIO(), profiler=profiler)
+    finally:
+        if started:
+            tracemalloc.stop()
+    return profiler
+
+
+def soak_test(iterations=SOAK_ITERATIONS, threshold_kb=SOAK_THRESHOLD_KB, warmup=SOAK_WARMUP):
+    """Render the same profile repeatedly and fail if memory keeps growing.
+
+    The baseline is taken after ``warmup`` renders so one-off caches
+    (font registration, glyph tables) are not counted as leaks. Renders
+    go to an in-memory buffer. Returns the retained growth in bytes and
+    raises ``RuntimeError`` when it exceeds ``threshold_kb``.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            build_cv(io.BytesIO())
+        gc.collect()
+        baseline = tracemalloc.take_snapshot()
+        for _ in range(iterations):
+            build_cv(io.BytesIO())
+        gc.collect()
+        final = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    
+    diff = final.compare_to(baseline, "lineno")
+    growth = sum(stat.size_diff for stat in diff)
+    if growth > threshold_kb * 1024:
+        top = "\n".join(str(stat) for stat in diff[:10])
+        raise RuntimeError(
+            f"Retained memory grew by {growth / 1024:.1f} KiB over {iterations} renders "
+            f"(threshold {threshold_kb} KiB). Top allocations:\n{top}"
+        )
+    return growth
 
 
 if __name__ == "__main__":
-    output_path = build_cv()
-    print(f"CV generated: {output_path}")
+    parser = argparse.ArgumentParser(description="Generate the CV PDF.")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="report peak/retained memory per stage for a warm render")
+    parser.add_argument("--soak", type=int, nargs="?", const=SOAK_ITERATIONS, metavar="N",
+                        help=f"render N times (default {SOAK_ITERATIONS}) and fail on memory growth")
+    parser.add_argument("--soak-threshold-kb", type=int, default=SOAK_THRESHOLD_KB,
+                        help="allowed retained growth for --soak, in KiB")
+    args = parser.parse_args()
+    if args.soak is not None and args.soak < 1:
+        parser.error("--soak N must be at least 1")
+    
+    if args.profile_memory:
+        print(profile_render().report())
+    elif args.soak is not None:
+        growth = soak_test(args.soak, args.soak_threshold_kb)
+        print(f"Soak test passed: {args.soak} renders, retained growth {growth / 1024:.1f} KiB")
+    else:
+        output_path = build_cv()
+        print(f"CV generated: {output_path}")